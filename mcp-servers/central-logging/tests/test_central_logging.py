@@ -806,8 +806,6 @@ class TestUS010Integration:
         stats = server.get_log_stats({})
         assert stats["total_logs"] >= 4
         assert len(stats["components"]) >= 4
-        
-        print("✅ All US-010 acceptance criteria verified!")
 
 
 class TestMCPToolFunctions:
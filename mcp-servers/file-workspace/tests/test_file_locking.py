@@ -613,8 +613,6 @@ class TestUS009Integration:
         
         final_status = server.get_file_lock_status({"file_path": "/workspace/temp.py"})
         assert final_status["status"] == "unlocked"
-        
-        print("✅ All US-009 acceptance criteria verified!")
 
 
 class TestMCPServerCoverage:
@@ -16,6 +16,14 @@ def print_section(title: str) -> None:
     print(f"{'=' * 60}\n")
 
 
+def print_exchange(request: dict, response: dict) -> None:
+    """Print a request and its response with a single write."""
+    print(
+        f"Request:\n{json.dumps(request, indent=2)}\n\n"
+        f"Response:\n{json.dumps(response, indent=2)}"
+    )
+
+
 def main():
     """Run the MCP server demo."""
     
@@ -56,13 +64,8 @@ def main():
         }
     }
     
-    print("Request:")
-    print(json.dumps(request, indent=2))
-    
     response = server.handle_request(request)
-    
-    print("\nResponse:")
-    print(json.dumps(response, indent=2))
+    print_exchange(request, response)
     
     # Handle unknown method
     print_section("Handling Unknown Method")
@@ -73,13 +76,8 @@ def main():
         "params": {}
     }
     
-    print("Request:")
-    print(json.dumps(unknown_request, indent=2))
-    
     error_response = server.handle_request(unknown_request)
-    
-    print("\nResponse:")
-    print(json.dumps(error_response, indent=2))
+    print_exchange(unknown_request, error_response)
     
     # Invalid request
     print_section("Handling Invalid Request")
@@ -87,13 +85,8 @@ def main():
         "method": "test"  # Missing jsonrpc and id
     }
     
-    print("Request:")
-    print(json.dumps(invalid_request, indent=2))
-    
     invalid_response = server.handle_request(invalid_request)
-    
-    print("\nResponse:")
-    print(json.dumps(invalid_response, indent=2))
+    print_exchange(invalid_request, invalid_response)
     
     print_section("Demo Complete")
     print("✓ All basic MCP server functionality demonstrated")
@@ -5,15 +5,6 @@ This package provides task coordination and dependency management capabilities
 for the multi-agent development system.
 """
 
-# MCP Server implementation using official MCP SDK
-from .task_coordinator_server_sdk import (
-    TaskCoordinatorServerSDK,
-    create_task_coordinator_server,
-)
-
-# Default implementation
-TaskCoordinatorServer = TaskCoordinatorServerSDK
-
 from .models.task import Task, TaskStatus
 from .models.dependency import Dependency, DependencyGraph
 
@@ -26,3 +17,26 @@ __all__ = [
     "Dependency",
     "DependencyGraph",
 ]
+
+
+def __getattr__(name):
+    # The MCP server implementation pulls in the MCP SDK, so import it only
+    # when first asked for; the models above stay usable without it
+    if name in (
+        "TaskCoordinatorServer",
+        "TaskCoordinatorServerSDK",
+        "create_task_coordinator_server",
+    ):
+        from .task_coordinator_server_sdk import (
+            TaskCoordinatorServerSDK,
+            create_task_coordinator_server,
+        )
+
+        # Default implementation
+        globals().update(
+            TaskCoordinatorServer=TaskCoordinatorServerSDK,
+            TaskCoordinatorServerSDK=TaskCoordinatorServerSDK,
+            create_task_coordinator_server=create_task_coordinator_server,
+        )
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,8 +2,10 @@
 Dependency management models with cycle detection
 """
 
+from collections import deque
+
 import networkx as nx
-from typing import Dict, List, Set, Any, Optional, TYPE_CHECKING
+from typing import Dict, List, Set, Any, Optional, Tuple, TYPE_CHECKING
 from .task import Task, TaskStatus
 
 if TYPE_CHECKING:
@@ -19,6 +21,8 @@ class DependencyError(Exception):
 class Dependency:
     """Individual dependency relationship"""
 
+    __slots__ = ("dependent_task_id", "depends_on_task_id")
+
     def __init__(self, dependent_task_id: str, depends_on_task_id: str):
         self.dependent_task_id = dependent_task_id
         self.depends_on_task_id = depends_on_task_id
@@ -38,16 +42,35 @@ class DependencyGraph:
         self.graph = nx.DiGraph()
         self.notification_system: Optional["NotificationSystem"] = None
 
+        # Reverse of self.dependencies: task id -> tasks still waiting on it.
+        # Lets completion and removal visit only the affected tasks.
+        self._dependents: Dict[str, Dict[str, None]] = {}
+
+        # Bumped whenever the edge set changes; keys the cached edge list
+        # used by get_visualization_data
+        self._edges_version = 0
+        self._edges_cache: Optional[Tuple[int, List[Dict[str, str]]]] = None
+
     def add_task(self, task: Task) -> None:
         """Add a task to the dependency graph"""
+        # Re-adding an id replaces its dependency list, so the old list must
+        # stop pointing back at it in the reverse index
+        for dep_id in self.dependencies.get(task.id, ()):
+            waiting = self._dependents.get(dep_id)
+            if waiting is not None:
+                waiting.pop(task.id, None)
+
         self.tasks[task.id] = task
         self.dependencies[task.id] = list(task.dependencies)
         self.graph.add_node(task.id)
+        for dep_id in task.dependencies:
+            self._dependents.setdefault(dep_id, {})[task.id] = None
 
         # Add existing dependencies to the graph
         for dep_id in task.dependencies:
             if dep_id in self.tasks:
                 self.graph.add_edge(dep_id, task.id)
+        self._edges_version += 1
 
     def add_dependency(self, dependent_task_id: str, depends_on_task_id: str) -> None:
         """
@@ -57,21 +80,33 @@ class DependencyGraph:
             dependent_task_id: The task that depends on another
             depends_on_task_id: The task that is depended upon
         """
+        # A self-loop is the trivial cycle, reject it without touching the graph
+        if dependent_task_id == depends_on_task_id:
+            raise DependencyError(
+                f"Circular dependency detected: task {dependent_task_id} cannot depend on itself"
+            )
         if dependent_task_id not in self.tasks:
             raise DependencyError(f"Task {dependent_task_id} not found in graph")
         if depends_on_task_id not in self.tasks:
             raise DependencyError(f"Task {depends_on_task_id} not found in graph")
 
-        # Check for cycles before adding
-        self.graph.add_edge(depends_on_task_id, dependent_task_id)
+        # Already an unresolved dependency with its edge in place: nothing to
+        # add. A dependency declared before its target existed has no edge
+        # yet, so it still goes through the cycle check below.
+        if self.tasks[dependent_task_id].has_dependency(
+            depends_on_task_id
+        ) and self.graph.has_edge(depends_on_task_id, dependent_task_id):
+            return
 
-        if not nx.is_directed_acyclic_graph(self.graph):
-            # Remove the edge that creates the cycle
-            self.graph.remove_edge(depends_on_task_id, dependent_task_id)
+        # Check for cycles before touching the graph
+        if self._would_create_cycle(dependent_task_id, depends_on_task_id):
             raise DependencyError(
                 f"Circular dependency detected: adding {depends_on_task_id} -> {dependent_task_id} would create a cycle"
             )
 
+        self.graph.add_edge(depends_on_task_id, dependent_task_id)
+        self._edges_version += 1
+
         # Update task dependencies
         self.tasks[dependent_task_id].add_dependency(depends_on_task_id)
         self.tasks[depends_on_task_id].add_dependent_task(dependent_task_id)
@@ -79,6 +114,46 @@ class DependencyGraph:
         # Update internal dependencies tracking
         if depends_on_task_id not in self.dependencies[dependent_task_id]:
             self.dependencies[dependent_task_id].append(depends_on_task_id)
+        self._dependents.setdefault(depends_on_task_id, {})[dependent_task_id] = None
+
+    def _would_create_cycle(
+        self, dependent_task_id: str, depends_on_task_id: str
+    ) -> bool:
+        """
+        Check whether adding an edge would make the graph cyclic
+
+        Runs Kahn's algorithm over the current graph plus the candidate edge
+        depends_on_task_id -> dependent_task_id: if peeling zero in-degree
+        nodes cannot reach every node, the candidate graph has a cycle.
+        """
+        if self.graph.has_edge(depends_on_task_id, dependent_task_id):
+            return False
+
+        indegree = dict(self.graph.in_degree())
+        indegree[dependent_task_id] += 1
+
+        adjacency = self.graph.succ
+        ready = deque(node for node, degree in indegree.items() if degree == 0)
+        popleft = ready.popleft
+        append = ready.append
+        visited = 0
+
+        while ready:
+            node = popleft()
+            visited += 1
+
+            for target in adjacency[node]:
+                remaining = indegree[target] - 1
+                indegree[target] = remaining
+                if not remaining:
+                    append(target)
+
+            if node == depends_on_task_id:
+                indegree[dependent_task_id] -= 1
+                if not indegree[dependent_task_id]:
+                    append(dependent_task_id)
+
+        return visited < len(indegree)
 
     def remove_task(self, task_id: str) -> None:
         """Remove a task from the dependency graph"""
@@ -86,42 +161,58 @@ class DependencyGraph:
             return
 
         # Remove dependencies from other tasks
-        for other_task_id, other_task in self.tasks.items():
-            if other_task_id != task_id:
-                if other_task.has_dependency(task_id):
-                    other_task.remove_dependency(task_id)
-                    self.dependencies[other_task_id] = [
-                        dep
-                        for dep in self.dependencies[other_task_id]
-                        if dep != task_id
-                    ]
+        for other_task_id in self._dependents.pop(task_id, {}):
+            if other_task_id != task_id and other_task_id in self.tasks:
+                self.tasks[other_task_id].remove_dependency(task_id)
+                self.dependencies[other_task_id] = [
+                    dep
+                    for dep in self.dependencies[other_task_id]
+                    if dep != task_id
+                ]
+
+        # This task no longer waits on anything
+        for dep_id in self.dependencies[task_id]:
+            waiting = self._dependents.get(dep_id)
+            if waiting is not None:
+                waiting.pop(task_id, None)
 
         # Remove from graph
         self.graph.remove_node(task_id)
+        self._edges_version += 1
 
         # Remove from internal structures
         del self.tasks[task_id]
         del self.dependencies[task_id]
 
+    def clear(self) -> None:
+        """Remove every task and dependency, keeping the notification system"""
+        self.tasks.clear()
+        self.dependencies.clear()
+        self.graph.clear()
+        self._dependents.clear()
+        self._edges_version += 1
+
     def has_cycles(self) -> bool:
         """Check if the graph has cycles"""
         return not nx.is_directed_acyclic_graph(self.graph)
 
     def get_blocked_tasks(self) -> List[str]:
         """Get list of tasks that are blocked by dependencies"""
-        blocked = []
-        for task_id, task in self.tasks.items():
-            if task.is_blocked() and task.status != TaskStatus.COMPLETED:
-                blocked.append(task_id)
-        return blocked
+        # Read each task's own dependency list so changes made through Task
+        # methods are seen, and report tasks in insertion order
+        return [
+            task_id
+            for task_id, task in self.tasks.items()
+            if task.dependencies and task.status != TaskStatus.COMPLETED
+        ]
 
     def get_ready_tasks(self) -> List[str]:
         """Get list of tasks that are ready to start (no dependencies)"""
-        ready = []
-        for task_id, task in self.tasks.items():
-            if task.can_start() and task.status == TaskStatus.PENDING:
-                ready.append(task_id)
-        return ready
+        return [
+            task_id
+            for task_id, task in self.tasks.items()
+            if not task.dependencies and task.status == TaskStatus.PENDING
+        ]
 
     def resolve_dependencies(self, completed_task_id: str) -> List[str]:
         """
@@ -135,11 +226,9 @@ class DependencyGraph:
         """
         newly_ready = []
 
-        # Get tasks that depend on the completed task
-        dependent_tasks = []
-        for task_id, deps in self.dependencies.items():
-            if completed_task_id in deps:
-                dependent_tasks.append(task_id)
+        # Tasks still waiting on the completed task; once resolved, the
+        # completed task has nothing left waiting on it
+        dependent_tasks = self._dependents.pop(completed_task_id, {})
 
         # Remove the completed task from their dependencies
         for task_id in dependent_tasks:
@@ -182,24 +271,37 @@ class DependencyGraph:
         return list(self.tasks.values())
 
     def get_visualization_data(self) -> Dict[str, Any]:
-        """Get data for visualizing the dependency graph"""
-        nodes = []
-        edges = []
-
-        # Create nodes
-        for task_id, task in self.tasks.items():
-            nodes.append(
-                {
-                    "id": task_id,
-                    "label": task.title,
-                    "status": task.status.value,
-                    "priority": task.priority,
-                }
-            )
+        """
+        Get data for visualizing the dependency graph
 
-        # Create edges
-        for source, target in self.graph.edges():
-            edges.append({"source": source, "target": target})
+        Edge dicts are shared between calls until the graph changes, so
+        callers must treat them as read-only.
+        """
+        # Create nodes; the count is known, so build the list in one go
+        nodes = [
+            {
+                "id": task_id,
+                "label": task.title,
+                "status": task.status.value,
+                "priority": task.priority,
+            }
+            for task_id, task in self.tasks.items()
+        ]
+
+        # Edges only change with the graph structure, so reuse the last list
+        # until a mutation bumps the version. Node status can change without
+        # the graph knowing, so nodes are always rebuilt.
+        cache = self._edges_cache
+        if cache is None or cache[0] != self._edges_version:
+            cache = (
+                self._edges_version,
+                [
+                    {"source": source, "target": target}
+                    for source, target in self.graph.edges()
+                ],
+            )
+            self._edges_cache = cache
+        edges = list(cache[1])
 
         return {"nodes": nodes, "edges": edges}
 
@@ -2,12 +2,25 @@
 Task model for dependency management
 """
 
+import sys
 from datetime import datetime, timezone
 from enum import Enum
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
 
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" natively from 3.11
+    _parse_timestamp = datetime.fromisoformat
+else:
+
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing "Z" for UTC"""
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+
 class TaskStatus(str, Enum):
     """Task status enumeration"""
 
@@ -42,6 +55,11 @@ class Task(BaseModel):
         default=None, description="Last update timestamp"
     )
 
+    def model_post_init(self, __context: Any) -> None:
+        """Drop duplicate ids passed at construction"""
+        self.dependencies[:] = dict.fromkeys(self.dependencies)
+        self.dependent_tasks[:] = dict.fromkeys(self.dependent_tasks)
+
     def add_dependency(self, task_id: str) -> None:
         """Add a dependency to this task"""
         if task_id not in self.dependencies:
@@ -92,18 +110,22 @@ class Task(BaseModel):
     def from_dict(cls, data: Dict[str, Any]) -> "Task":
         """Create task from dictionary"""
         # Convert string timestamps back to datetime objects
-        created_at = datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
+        created_at = _parse_timestamp(data["created_at"])
         updated_at = None
         if data.get("updated_at"):
-            updated_at = datetime.fromisoformat(
-                data["updated_at"].replace("Z", "+00:00")
-            )
+            updated_at = _parse_timestamp(data["updated_at"])
+
+        # Look the status up by value directly; fall back to the enum call
+        # so unknown values still raise the usual ValueError
+        status = TaskStatus._value2member_map_.get(data["status"]) or TaskStatus(
+            data["status"]
+        )
 
         return cls(
             id=data["id"],
             title=data["title"],
             description=data["description"],
-            status=TaskStatus(data["status"]),
+            status=status,
             priority=data["priority"],
             dependencies=data.get("dependencies", []),
             dependent_tasks=data.get("dependent_tasks", []),
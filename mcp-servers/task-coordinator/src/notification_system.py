@@ -9,6 +9,8 @@ from typing import Dict, List, Callable, Any, Optional
 class NotificationEvent:
     """Event object for notifications"""
 
+    __slots__ = ("event_type", "task_id", "newly_ready_tasks", "timestamp")
+
     def __init__(
         self,
         event_type: str,
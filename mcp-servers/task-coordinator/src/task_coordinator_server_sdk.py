@@ -8,7 +8,9 @@ using the core business logic models.
 import json
 import logging
 import sys
-from typing import Any, Dict, List
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent, Resource
@@ -19,6 +21,179 @@ from .models.dependency import DependencyGraph, DependencyError
 from .notification_system import NotificationSystem
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a tool or resource payload to compact JSON"""
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Shared by the console handlers of every server instance
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
+# Required create_task fields, fetched together in a single C-level call
+_CREATE_TASK_REQUIRED = itemgetter("task_id", "title")
+
+
+@dataclass
+class CreateTaskArgs:
+    """Parsed create_task arguments"""
+
+    task_id: str
+    title: str
+    description: Optional[str] = None
+    priority: int = 1
+    dependencies: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_arguments(cls, arguments: Dict[str, Any]) -> "CreateTaskArgs":
+        """Build from a create_task argument dict, validating required fields"""
+        try:
+            task_id, title = _CREATE_TASK_REQUIRED(arguments)
+        except KeyError:
+            task_id = title = None
+        if not task_id or not title:
+            raise ValueError("task_id and title are required")
+
+        return cls(
+            task_id=task_id,
+            title=title,
+            description=arguments.get("description"),
+            priority=arguments.get("priority", 1),
+            dependencies=arguments.get("dependencies", []),
+        )
+
+
+# Tool and resource definitions are static, so build them once per process
+# rather than on every list request or server construction
+_TOOL_SCHEMAS: List[Tool] = [
+    Tool(
+        name="create_task",
+        description="Create a new task",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_id": {
+                    "type": "string",
+                    "description": "Unique task identifier",
+                },
+                "title": {"type": "string", "description": "Task title"},
+                "description": {
+                    "type": "string",
+                    "description": "Task description",
+                },
+                "priority": {
+                    "type": "integer",
+                    "description": "Task priority (1-10)",
+                },
+                "dependencies": {
+                    "type": "array",
+                    "description": "List of dependent task IDs",
+                    "items": {"type": "string"},
+                },
+            },
+            "required": ["task_id", "title"],
+        },
+    ),
+    Tool(
+        name="create_tasks",
+        description="Create several tasks in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tasks": {
+                    "type": "array",
+                    "description": "create_task arguments for each task, created in order",
+                    "items": {"type": "object"},
+                },
+            },
+            "required": ["tasks"],
+        },
+    ),
+    Tool(
+        name="add_dependency",
+        description="Add a dependency between tasks",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dependent_task_id": {
+                    "type": "string",
+                    "description": "Task that depends on another",
+                },
+                "depends_on_task_id": {
+                    "type": "string",
+                    "description": "Task that is depended upon",
+                },
+            },
+            "required": ["dependent_task_id", "depends_on_task_id"],
+        },
+    ),
+    Tool(
+        name="get_blocked_tasks",
+        description="Get list of blocked tasks",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get_ready_tasks",
+        description="Get list of tasks ready to start",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="resolve_dependencies",
+        description="Resolve dependencies when a task is completed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "completed_task_id": {
+                    "type": "string",
+                    "description": "ID of the completed task",
+                }
+            },
+            "required": ["completed_task_id"],
+        },
+    ),
+    Tool(
+        name="get_visualization_data",
+        description="Get dependency graph visualization data",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False,
+        },
+    ),
+]
+
+_RESOURCE_SCHEMAS: List[Resource] = [
+    Resource(
+        uri="tasks://blocked",
+        name="Blocked Tasks",
+        description="List of tasks that are blocked by dependencies",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="tasks://ready",
+        name="Ready Tasks",
+        description="List of tasks that are ready to be executed",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="tasks://graph",
+        name="Dependency Graph",
+        description="Visualization data for the dependency graph",
+        mimeType="application/json",
+    ),
+]
+
+
 class TaskCoordinatorServerSDK:
     """
     Task Coordinator MCP Server using the official MCP Python SDK.
@@ -59,15 +234,14 @@ class TaskCoordinatorServerSDK:
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration."""
         logger = logging.getLogger(self.name)
-        logger.setLevel(logging.INFO)
 
+        # Configure the logger only the first time a server uses this name,
+        # leaving any level set since then alone
         if not logger.handlers:
             handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
+            handler.setFormatter(_LOG_FORMATTER)
             logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
 
         return logger
 
@@ -77,95 +251,7 @@ class TaskCoordinatorServerSDK:
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """List available task coordinator tools"""
-            return [
-                Tool(
-                    name="create_task",
-                    description="Create a new task",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "task_id": {
-                                "type": "string",
-                                "description": "Unique task identifier",
-                            },
-                            "title": {"type": "string", "description": "Task title"},
-                            "description": {
-                                "type": "string",
-                                "description": "Task description",
-                            },
-                            "priority": {
-                                "type": "integer",
-                                "description": "Task priority (1-10)",
-                            },
-                            "dependencies": {
-                                "type": "array",
-                                "description": "List of dependent task IDs",
-                                "items": {"type": "string"},
-                            },
-                        },
-                        "required": ["task_id", "title"],
-                    },
-                ),
-                Tool(
-                    name="add_dependency",
-                    description="Add a dependency between tasks",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "dependent_task_id": {
-                                "type": "string",
-                                "description": "Task that depends on another",
-                            },
-                            "depends_on_task_id": {
-                                "type": "string",
-                                "description": "Task that is depended upon",
-                            },
-                        },
-                        "required": ["dependent_task_id", "depends_on_task_id"],
-                    },
-                ),
-                Tool(
-                    name="get_blocked_tasks",
-                    description="Get list of blocked tasks",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False,
-                    },
-                ),
-                Tool(
-                    name="get_ready_tasks",
-                    description="Get list of tasks ready to start",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False,
-                    },
-                ),
-                Tool(
-                    name="resolve_dependencies",
-                    description="Resolve dependencies when a task is completed",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "completed_task_id": {
-                                "type": "string",
-                                "description": "ID of the completed task",
-                            }
-                        },
-                        "required": ["completed_task_id"],
-                    },
-                ),
-                Tool(
-                    name="get_visualization_data",
-                    description="Get dependency graph visualization data",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False,
-                    },
-                ),
-            ]
+            return _TOOL_SCHEMAS
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -174,6 +260,8 @@ class TaskCoordinatorServerSDK:
                 # Route to the appropriate method using the core logic
                 if name == "create_task":
                     result = self._create_task(arguments)
+                elif name == "create_tasks":
+                    result = self._create_tasks(arguments)
                 elif name == "add_dependency":
                     result = self._add_dependency(arguments)
                 elif name == "get_blocked_tasks":
@@ -187,7 +275,7 @@ class TaskCoordinatorServerSDK:
                 else:
                     result = {"error": f"Unknown tool: {name}"}
 
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=_dumps(result))]
 
             except DependencyError as e:
                 self.logger.error(f"Dependency error in tool {name}: {str(e)}")
@@ -202,39 +290,20 @@ class TaskCoordinatorServerSDK:
         @self.server.list_resources()
         async def list_resources() -> List[Resource]:
             """List available resources"""
-            return [
-                Resource(
-                    uri="tasks://blocked",
-                    name="Blocked Tasks",
-                    description="List of tasks that are blocked by dependencies",
-                    mimeType="application/json",
-                ),
-                Resource(
-                    uri="tasks://ready",
-                    name="Ready Tasks",
-                    description="List of tasks that are ready to be executed",
-                    mimeType="application/json",
-                ),
-                Resource(
-                    uri="tasks://graph",
-                    name="Dependency Graph",
-                    description="Visualization data for the dependency graph",
-                    mimeType="application/json",
-                ),
-            ]
+            return _RESOURCE_SCHEMAS
 
         @self.server.read_resource()
         async def read_resource(uri: str) -> str:
             """Read resource content"""
             if uri == "tasks://blocked":
                 blocked_data = self._get_blocked_tasks({})
-                return json.dumps(blocked_data, indent=2)
+                return _dumps(blocked_data)
             elif uri == "tasks://ready":
                 ready_data = self._get_ready_tasks({})
-                return json.dumps(ready_data, indent=2)
+                return _dumps(ready_data)
             elif uri == "tasks://graph":
                 graph_data = self._get_visualization_data({})
-                return json.dumps(graph_data, indent=2)
+                return _dumps(graph_data)
             else:
                 raise ValueError(f"Unknown resource: {uri}")
 
@@ -242,35 +311,73 @@ class TaskCoordinatorServerSDK:
     def _create_task(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Create a task using core logic"""
         try:
-            task_id = arguments.get("task_id")
-            title = arguments.get("title")
-            description = arguments.get("description")
-            priority = arguments.get("priority", 1)
-            dependencies = arguments.get("dependencies", [])
-
-            if not task_id or not title:
-                raise ValueError("task_id and title are required")
-
-            # Create task
-            task = Task(
-                id=task_id,
-                title=title,
-                description=description,
-                priority=priority,
-                dependencies=dependencies,
-            )
+            return self._insert_task(arguments)
+        except Exception as e:
+            return {"error": str(e)}
 
-            # Add to dependency graph
-            self.dependency_graph.add_task(task)
+    def _create_tasks(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a batch of tasks, reporting a result for each one"""
+        try:
+            tasks = arguments.get("tasks")
+            if not isinstance(tasks, list):
+                raise ValueError("tasks must be a list of task arguments")
 
-            return {
-                "success": True,
-                "task_id": task_id,
-                "message": f"Task {task_id} created successfully",
-            }
+            return {"results": self._create_tasks_bulk(tasks)}
         except Exception as e:
             return {"error": str(e)}
 
+    def _create_tasks_bulk(
+        self, payloads: List[Union[Dict[str, Any], CreateTaskArgs]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several tasks in one pass.
+
+        Args:
+            payloads: create_task argument dicts, or already-parsed
+                CreateTaskArgs which skip dict validation, inserted in order
+
+        Returns:
+            One create_task result per payload
+        """
+        results = []
+        append = results.append
+        insert = self._insert_task
+        insert_typed = self._create_task_typed
+        for arguments in payloads:
+            try:
+                if isinstance(arguments, CreateTaskArgs):
+                    append(insert_typed(arguments))
+                elif isinstance(arguments, dict):
+                    append(insert(arguments))
+                else:
+                    append({"error": "each task must be an object"})
+            except Exception as e:
+                append({"error": str(e)})
+        return results
+
+    def _insert_task(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate create_task arguments and add the task to the graph"""
+        return self._create_task_typed(CreateTaskArgs.from_arguments(arguments))
+
+    def _create_task_typed(self, args: CreateTaskArgs) -> Dict[str, Any]:
+        """Add an already-parsed task to the graph"""
+        task = Task(
+            id=args.task_id,
+            title=args.title,
+            description=args.description,
+            priority=args.priority,
+            dependencies=args.dependencies,
+        )
+
+        # Add to dependency graph
+        self.dependency_graph.add_task(task)
+
+        return {
+            "success": True,
+            "task_id": args.task_id,
+            "message": f"Task {args.task_id} created successfully",
+        }
+
     def _add_dependency(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Add dependency using core logic"""
         try:
@@ -282,21 +389,49 @@ class TaskCoordinatorServerSDK:
                     "dependent_task_id and depends_on_task_id are required"
                 )
 
-            # Add dependency (this will check for cycles)
-            self.dependency_graph.add_dependency(dependent_task_id, depends_on_task_id)
-
-            return {
-                "success": True,
-                "message": f"Dependency added: {dependent_task_id} depends on {depends_on_task_id}",
-            }
+            return self._insert_dependency(dependent_task_id, depends_on_task_id)
         except Exception as e:
             return {"error": str(e)}
 
+    def _add_dependencies_bulk(
+        self, edges: List[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Add several dependencies in one pass.
+
+        Args:
+            edges: (dependent_task_id, depends_on_task_id) pairs, added in order
+
+        Returns:
+            One add_dependency result per edge
+        """
+        results = []
+        append = results.append
+        insert = self._insert_dependency
+        for dependent_task_id, depends_on_task_id in edges:
+            try:
+                append(insert(dependent_task_id, depends_on_task_id))
+            except Exception as e:
+                append({"error": str(e)})
+        return results
+
+    def _insert_dependency(
+        self, dependent_task_id: str, depends_on_task_id: str
+    ) -> Dict[str, Any]:
+        """Add a dependency edge to the graph"""
+        # Add dependency (this will check for cycles)
+        self.dependency_graph.add_dependency(dependent_task_id, depends_on_task_id)
+
+        return {
+            "success": True,
+            "message": f"Dependency added: {dependent_task_id} depends on {depends_on_task_id}",
+        }
+
     def _get_blocked_tasks(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get blocked tasks using core logic"""
         try:
             blocked_tasks = self.dependency_graph.get_blocked_tasks()
-            return {"blocked_tasks": blocked_tasks, "count": len(blocked_tasks)}
+            return {"blocked_tasks": blocked_tasks}
         except Exception as e:
             return {"error": str(e)}
 
@@ -304,7 +439,7 @@ class TaskCoordinatorServerSDK:
         """Get ready tasks using core logic"""
         try:
             ready_tasks = self.dependency_graph.get_ready_tasks()
-            return {"ready_tasks": ready_tasks, "count": len(ready_tasks)}
+            return {"ready_tasks": ready_tasks}
         except Exception as e:
             return {"error": str(e)}
 
@@ -325,7 +460,6 @@ class TaskCoordinatorServerSDK:
                 "success": True,
                 "completed_task_id": completed_task_id,
                 "newly_ready_tasks": newly_ready_tasks,
-                "count": len(newly_ready_tasks),
             }
         except Exception as e:
             return {"error": str(e)}
@@ -338,6 +472,17 @@ class TaskCoordinatorServerSDK:
         except Exception as e:
             return {"error": str(e)}
 
+    def reset(self) -> None:
+        """
+        Drop all tasks, dependencies, callbacks and recorded events.
+
+        The MCP server and its registered handlers are kept, so a reset
+        coordinator can be reused without paying for construction again.
+        """
+        self.dependency_graph.clear()
+        self.notification_system.callbacks.clear()
+        self.notification_system.clear_event_history()
+
     async def run(self) -> None:
         """Run the MCP server using the official SDK"""
         self.logger.info(f"Starting {self.name} v{self.version} with MCP SDK")
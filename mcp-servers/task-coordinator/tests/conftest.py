@@ -0,0 +1,75 @@
+"""
+pytest configuration for task coordinator tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Make the package root importable as "src" once for every test module,
+# wherever pytest is started from
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def pytest_configure(config):
+    """Configure pytest for this test suite."""
+    config.addinivalue_line(
+        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
+    )
+    config.addinivalue_line(
+        "markers", "integration: marks end-to-end workflow tests"
+    )
+    config.addinivalue_line(
+        "markers", "perf: marks pytest-benchmark timing tests (run with '-m perf')"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip timing tests unless asked for and keep each test class on one
+    pytest-xdist worker.
+
+    Timing tests run only when selected with ``-m perf`` or
+    ``--benchmark-only`` and pytest-benchmark is installed.
+
+    Under ``-n auto --dist loadgroup`` the classes then run in parallel while
+    the module-scoped server fixtures they share are built once per worker.
+    """
+    if not config.pluginmanager.hasplugin("benchmark"):
+        skip_perf = pytest.mark.skip(reason="pytest-benchmark is not installed")
+    elif "perf" in config.getoption("markexpr") or config.getoption("benchmark_only"):
+        skip_perf = None
+    else:
+        skip_perf = pytest.mark.skip(reason="timing test, run with -m perf")
+
+    if skip_perf is not None:
+        for item in items:
+            if "perf" in item.keywords:
+                item.add_marker(skip_perf)
+
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+
+    for item in items:
+        # "path::Class::test" groups by class, "path::test" by module
+        group = item.nodeid.split("[", 1)[0].rsplit("::", 1)[0]
+        item.add_marker(pytest.mark.xdist_group(group))
+
+
+@pytest.fixture(scope="session")
+def shared_server(request):
+    """One coordinator per session, or per worker when running under pytest-xdist"""
+    # Imported here so that runs which never request a server, such as the
+    # model-only test modules, don't load the MCP SDK
+    from src.task_coordinator_server_sdk import TaskCoordinatorServerSDK
+
+    worker_id = getattr(request.config, "workerinput", {}).get("workerid", "master")
+    return TaskCoordinatorServerSDK(f"session-{worker_id}", "1.0.0")
+
+
+@pytest.fixture
+def server(shared_server):
+    """The shared coordinator, emptied again after each test"""
+    yield shared_server
+    shared_server.reset()
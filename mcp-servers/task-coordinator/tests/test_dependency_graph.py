@@ -3,11 +3,6 @@ Tests for Dependency Graph validation and cycle detection - TDD implementation
 """
 
 import pytest
-from typing import List, Dict, Set
-
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.models.dependency import DependencyGraph, Dependency, DependencyError
 from src.models.task import Task, TaskStatus
@@ -81,6 +76,43 @@ class TestDependencyGraph:
         with pytest.raises(DependencyError, match="Circular dependency detected"):
             graph.add_dependency("task-1", "task-3")
 
+    def test_rejected_cycle_leaves_graph_unchanged(self):
+        """Test that a rejected dependency never reaches the graph"""
+        graph = DependencyGraph()
+        
+        for i in range(1, 4):
+            graph.add_task(Task(id=f"task-{i}", title=f"Task {i}", description=f"Task {i}"))
+        
+        graph.add_dependency("task-2", "task-1")  # task-2 depends on task-1
+        graph.add_dependency("task-3", "task-2")  # task-3 depends on task-2
+        
+        with pytest.raises(DependencyError, match="Circular dependency detected"):
+            graph.add_dependency("task-1", "task-3")
+        with pytest.raises(DependencyError, match="Circular dependency detected"):
+            graph.add_dependency("task-1", "task-1")
+        
+        assert graph.graph.number_of_edges() == 2
+        assert not graph.tasks["task-1"].has_dependency("task-3")
+        assert graph.has_cycles() is False
+
+    def test_duplicate_dependency_is_ignored(self):
+        """Test adding the same dependency twice leaves a single edge"""
+        graph = DependencyGraph()
+        
+        graph.add_task(Task(id="task-1", title="Task 1", description="First task"))
+        graph.add_task(Task(id="task-2", title="Task 2", description="Second task"))
+        graph.add_dependency("task-2", "task-1")
+        graph.add_dependency("task-2", "task-1")
+        
+        assert graph.dependencies["task-2"] == ["task-1"]
+        assert graph.tasks["task-2"].dependencies == ["task-1"]
+        assert graph.graph.number_of_edges() == 1
+        
+        # Once resolved, the same dependency can be added back
+        graph.resolve_dependencies("task-1")
+        graph.add_dependency("task-2", "task-1")
+        assert graph.get_blocked_tasks() == ["task-2"]
+
     def test_valid_dependency_chain(self):
         """Test that valid dependency chains don't raise errors"""
         graph = DependencyGraph()
@@ -140,6 +172,88 @@ class TestDependencyGraph:
         assert "task-2" not in ready_tasks
         assert "task-3" not in ready_tasks
 
+    def test_ready_and_blocked_track_mutations(self):
+        """Test that ready/blocked queries follow adds, resolutions and removals"""
+        graph = DependencyGraph()
+        
+        for i in range(1, 4):
+            graph.add_task(Task(id=f"task-{i}", title=f"Task {i}", description=f"Task {i}"))
+        
+        graph.add_dependency("task-2", "task-1")  # task-2 depends on task-1
+        graph.add_dependency("task-3", "task-2")  # task-3 depends on task-2
+        
+        assert graph.get_ready_tasks() == ["task-1"]
+        assert graph.get_blocked_tasks() == ["task-2", "task-3"]
+        
+        graph.resolve_dependencies("task-1")
+        assert graph.get_ready_tasks() == ["task-1", "task-2"]
+        assert graph.get_blocked_tasks() == ["task-3"]
+        
+        graph.remove_task("task-2")
+        assert graph.get_ready_tasks() == ["task-1", "task-3"]
+        assert graph.get_blocked_tasks() == []
+        
+        graph.clear()
+        assert graph.get_ready_tasks() == []
+        assert graph.tasks == {}
+
+    def test_ready_and_blocked_partition_tasks(self):
+        """Test every task is filed as exactly one of ready or blocked"""
+        graph = DependencyGraph()
+        
+        for i in range(6):
+            graph.add_task(Task(id=f"task-{i}", title=f"Task {i}", description=f"Task {i}"))
+        for dependent, depends_on in [(1, 0), (2, 0), (3, 1), (3, 2), (5, 4)]:
+            graph.add_dependency(f"task-{dependent}", f"task-{depends_on}")
+        graph.resolve_dependencies("task-0")
+        graph.remove_task("task-4")
+        
+        ready = set(graph.get_ready_tasks())
+        blocked = set(graph.get_blocked_tasks())
+        assert ready.isdisjoint(blocked)
+        assert ready | blocked == set(graph.tasks)
+        assert blocked == {"task-3"}
+
+    def test_ready_tasks_reflect_status_changes(self):
+        """Test ready queries see status updates made outside the graph"""
+        graph = DependencyGraph()
+        
+        task1 = Task(id="task-1", title="Task 1", description="First task")
+        graph.add_task(task1)
+        assert graph.get_ready_tasks() == ["task-1"]
+        
+        # No graph mutation happened, so a cache keyed on graph changes
+        # would wrongly keep returning task-1 here
+        task1.update_status(TaskStatus.IN_PROGRESS)
+        assert graph.get_ready_tasks() == []
+
+    def test_ready_tasks_keep_insertion_order(self):
+        """Test a task that becomes ready is reported in its insertion position"""
+        graph = DependencyGraph()
+        
+        graph.add_task(Task(id="A", title="A", description="A", dependencies=["X"]))
+        graph.add_task(Task(id="B", title="B", description="B"))
+        graph.add_task(Task(id="C", title="C", description="C"))
+        assert graph.get_ready_tasks() == ["B", "C"]
+        
+        graph.resolve_dependencies("X")
+        assert graph.get_ready_tasks() == ["A", "B", "C"]
+
+    def test_ready_tasks_reflect_task_dependency_changes(self):
+        """Test ready/blocked queries see dependencies changed on the Task itself"""
+        graph = DependencyGraph()
+        
+        graph.add_task(Task(id="A", title="A", description="A"))
+        graph.add_task(Task(id="B", title="B", description="B"))
+        
+        graph.tasks["B"].add_dependency("A")
+        assert graph.get_ready_tasks() == ["A"]
+        assert graph.get_blocked_tasks() == ["B"]
+        
+        graph.tasks["B"].remove_dependency("A")
+        assert graph.get_ready_tasks() == ["A", "B"]
+        assert graph.get_blocked_tasks() == []
+
     def test_resolve_dependencies(self):
         """Test resolving dependencies when a task is completed"""
         graph = DependencyGraph()
@@ -164,6 +278,61 @@ class TestDependencyGraph:
         assert not graph.tasks["task-2"].has_dependency("task-1")
         assert not graph.tasks["task-3"].has_dependency("task-1")
 
+    def test_resolve_dependencies_after_remove(self):
+        """Test resolving only touches tasks that still wait on the completed one"""
+        graph = DependencyGraph()
+        
+        for i in range(1, 4):
+            graph.add_task(Task(id=f"task-{i}", title=f"Task {i}", description=f"Task {i}"))
+        graph.add_dependency("task-2", "task-1")
+        graph.add_dependency("task-3", "task-1")
+        graph.remove_task("task-2")
+        
+        assert graph.resolve_dependencies("task-1") == ["task-3"]
+        assert graph.resolve_dependencies("task-1") == []
+
+    def test_readd_task_drops_old_dependents(self):
+        """Test re-adding a task under the same id forgets its old dependencies"""
+        graph = DependencyGraph()
+        
+        graph.add_task(Task(id="task-1", title="Task 1", description="Task 1"))
+        graph.add_task(
+            Task(id="task-2", title="Task 2", description="Task 2", dependencies=["task-1"])
+        )
+        graph.add_task(Task(id="task-2", title="Task 2", description="Task 2"))
+        
+        assert graph.resolve_dependencies("task-1") == []
+        assert graph.get_ready_tasks() == ["task-1", "task-2"]
+
+    def test_add_dependency_after_readd(self):
+        """Test a dependency dropped by re-adding a task can be added again"""
+        graph = DependencyGraph()
+        
+        graph.add_task(Task(id="task-1", title="Task 1", description="Task 1"))
+        graph.add_task(
+            Task(id="task-2", title="Task 2", description="Task 2", dependencies=["task-1"])
+        )
+        graph.add_task(Task(id="task-2", title="Task 2", description="Task 2"))
+        graph.add_dependency("task-2", "task-1")
+        
+        assert graph.tasks["task-2"].has_dependency("task-1")
+        assert graph.get_blocked_tasks() == ["task-2"]
+        assert graph.get_ready_tasks() == ["task-1"]
+
+    def test_add_dependency_declared_before_target(self):
+        """Test a dependency on a task created later still gets its edge"""
+        graph = DependencyGraph()
+        
+        graph.add_task(
+            Task(id="task-2", title="Task 2", description="Task 2", dependencies=["task-1"])
+        )
+        graph.add_task(Task(id="task-1", title="Task 1", description="Task 1"))
+        graph.add_dependency("task-2", "task-1")
+        
+        assert graph.graph.has_edge("task-1", "task-2")
+        with pytest.raises(DependencyError, match="Circular dependency detected"):
+            graph.add_dependency("task-1", "task-2")
+
     def test_topological_sort(self):
         """Test topological sorting of tasks"""
         graph = DependencyGraph()
@@ -235,6 +404,25 @@ class TestDependencyGraph:
         assert edge["source"] == "task-1"
         assert edge["target"] == "task-2"
 
+    def test_visualization_edges_follow_mutations(self):
+        """Test cached visualization edges are rebuilt after the graph changes"""
+        graph = DependencyGraph()
+        
+        for i in range(1, 4):
+            graph.add_task(Task(id=f"task-{i}", title=f"Task {i}", description=f"Task {i}"))
+        graph.add_dependency("task-2", "task-1")
+        assert graph.get_visualization_data()["edges"] == [{"source": "task-1", "target": "task-2"}]
+        
+        graph.add_dependency("task-3", "task-2")
+        assert len(graph.get_visualization_data()["edges"]) == 2
+        
+        graph.remove_task("task-2")
+        assert graph.get_visualization_data()["edges"] == []
+        
+        graph.tasks["task-1"].update_status(TaskStatus.COMPLETED)
+        statuses = {node["id"]: node["status"] for node in graph.get_visualization_data()["nodes"]}
+        assert statuses["task-1"] == TaskStatus.COMPLETED.value
+
 
 class TestDependencyError:
     """Test cases for DependencyError exception"""
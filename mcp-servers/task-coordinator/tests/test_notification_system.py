@@ -3,16 +3,11 @@ Tests for notification system when dependencies are resolved - TDD implementatio
 """
 
 import pytest
-from typing import List, Dict, Any, Callable
-from unittest.mock import Mock, call
-
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from unittest.mock import Mock
 
 from src.models.task import Task, TaskStatus
 from src.models.dependency import DependencyGraph
-from src.notification_system import NotificationSystem, NotificationEvent, NotificationCallback
+from src.notification_system import NotificationSystem, NotificationEvent
 
 
 class TestNotificationSystem:
@@ -5,46 +5,149 @@ Test the new MCP SDK-based implementation to ensure it provides
 the same functionality as the legacy implementation.
 """
 
-import pytest
-import asyncio
 import json
-from unittest.mock import Mock, patch
+import logging
+
+import pytest
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+from src.task_coordinator_server_sdk import (
+    _TOOL_SCHEMAS,
+    _dumps,
+    CreateTaskArgs,
+    TaskCoordinatorServerSDK,
+    create_task_coordinator_server,
+)
+
+
+# Methods backing the registered MCP tools
+EXPECTED_METHODS = frozenset({
+    "_create_task",
+    "_create_tasks",
+    "_add_dependency",
+    "_get_blocked_tasks",
+    "_get_ready_tasks",
+    "_resolve_dependencies",
+    "_get_visualization_data",
+})
+
+
+TOOLS_BY_NAME = {tool.name: tool for tool in _TOOL_SCHEMAS}
+
+# create_task arguments for tests that only care about the task id
+BASE_CREATE = {"title": "Test Task", "description": "A test task"}
+
+
+async def _call_tool(server, name, arguments):
+    """Call a tool through the registered MCP handler and decode its result"""
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    result = await handler(request)
+    return json.loads(result.root.content[0].text)
+
+
+def _build_chain(server):
+    """Add the linear chain chain-task-0 -> ... -> chain-task-4 to server"""
+    results = server._create_tasks_bulk([
+        CreateTaskArgs(f"chain-task-{i}", f"Chain Task {i}", f"Task {i} in dependency chain")
+        for i in range(5)
+    ])
+    assert all(result["success"] is True for result in results)
+
+    results = server._add_dependencies_bulk(
+        [(f"chain-task-{i}", f"chain-task-{i-1}") for i in range(1, 5)]
+    )
+    assert all(result["success"] is True for result in results)
+
+    return server
+
+
+def _build_parent_child(server):
+    """Add parent-task with two children depending on it to server"""
+    results = server._create_tasks_bulk([
+        {
+            "task_id": "parent-task",
+            "title": "Parent Task",
+            "description": "Task that others depend on"
+        },
+        *(
+            {
+                "task_id": f"child-task-{i}",
+                "title": f"Child Task {i}",
+                "description": f"Child task {i}"
+            }
+            for i in (1, 2)
+        ),
+    ])
+    assert all(result["success"] is True for result in results)
+
+    results = server._add_dependencies_bulk(
+        [("child-task-1", "parent-task"), ("child-task-2", "parent-task")]
+    )
+    assert all(result["success"] is True for result in results)
+
+    return server
 
-from mcp.types import TextContent
-from src.task_coordinator_server_sdk import TaskCoordinatorServerSDK, create_task_coordinator_server
+
+@pytest.fixture(scope="module")
+def chain_server():
+    """Server holding the linear chain; read-only"""
+    return _build_chain(TaskCoordinatorServerSDK("chain-test", "1.0.0"))
+
+
+@pytest.fixture(scope="module")
+def parent_child_server():
+    """Server holding parent-task and its two children; read-only"""
+    return _build_parent_child(TaskCoordinatorServerSDK("parent-child-test", "1.0.0"))
+
+
+@pytest.fixture
+def mutable_chain_server(server):
+    """The shared server holding the linear chain, for tests that mutate it"""
+    return _build_chain(server)
+
+
+@pytest.fixture
+def mutable_parent_child_server(server):
+    """The shared server holding parent-task and its children, for tests that mutate it"""
+    return _build_parent_child(server)
+
+
+def _assert_shape(result, **fields):
+    """Assert result is a dict holding each named field with the given type"""
+    assert isinstance(result, dict)
+    assert fields.keys() <= result.keys(), sorted(fields.keys() - result.keys())
+    for key, expected_type in fields.items():
+        assert isinstance(result[key], expected_type), key
 
 
 class TestTaskCoordinatorServerSDK:
     """Test cases for the MCP SDK-based task coordinator server"""
     
-    def test_server_initialization(self):
-        """Test that the server initializes correctly"""
-        server = TaskCoordinatorServerSDK("test-coordinator", "1.0.0")
+    @pytest.mark.parametrize(
+        "factory,args,name,version",
+        [
+            (TaskCoordinatorServerSDK, ("test-coordinator", "1.0.0"), "test-coordinator", "1.0.0"),
+            (create_task_coordinator_server, ("factory-test", "2.0.0"), "factory-test", "2.0.0"),
+            (create_task_coordinator_server, (), "task-coordinator", "1.0.0"),
+        ],
+        ids=["constructor", "factory", "factory-defaults"],
+    )
+    def test_server_construction(self, factory, args, name, version):
+        """Test the constructor and factory function build a configured server"""
+        server = factory(*args)
         
-        assert server.name == "test-coordinator"
-        assert server.version == "1.0.0"
+        assert isinstance(server, TaskCoordinatorServerSDK)
+        assert server.name == name
+        assert server.version == version
         assert server.server is not None
         assert server.dependency_graph is not None
-        
-    def test_factory_function(self):
-        """Test the factory function creates server correctly"""
-        server = create_task_coordinator_server("factory-test", "2.0.0")
-        
-        assert isinstance(server, TaskCoordinatorServerSDK)
-        assert server.name == "factory-test"
-        assert server.version == "2.0.0"
-        
-    def test_factory_function_defaults(self):
-        """Test the factory function with default parameters"""
-        server = create_task_coordinator_server()
-        
-        assert isinstance(server, TaskCoordinatorServerSDK)
-        assert server.name == "task-coordinator"
-        assert server.version == "1.0.0"
     
-    def test_create_task_functionality(self):
+    def test_create_task_functionality(self, server):
         """Test the create task functionality"""
-        server = TaskCoordinatorServerSDK("test-coordinator", "1.0.0")
         
         # Test creating a task
         result = server._create_task({
@@ -58,23 +161,18 @@ class TestTaskCoordinatorServerSDK:
         assert result["success"] is True
         assert result["task_id"] == "test-task-1"
         assert "message" in result
+        
+        task = server.dependency_graph.tasks[result["task_id"]]
+        assert task.title == "Test Task"
+        assert task.description == "A test task"
+        assert task.priority == 5
     
-    def test_add_dependency_functionality(self):
+    def test_add_dependency_functionality(self, server):
         """Test the add dependency functionality"""
-        server = TaskCoordinatorServerSDK("test-coordinator", "1.0.0")
         
         # Create two tasks first
-        server._create_task({
-            "task_id": "task-1",
-            "title": "First Task",
-            "description": "First task"
-        })
-        
-        server._create_task({
-            "task_id": "task-2", 
-            "title": "Second Task",
-            "description": "Second task"
-        })
+        server._create_task({**BASE_CREATE, "task_id": "task-1"})
+        server._create_task({**BASE_CREATE, "task_id": "task-2"})
         
         # Add dependency
         result = server._add_dependency({
@@ -85,90 +183,78 @@ class TestTaskCoordinatorServerSDK:
         assert result["success"] is True
         assert "message" in result
     
-    def test_get_blocked_tasks_functionality(self):
-        """Test the get blocked tasks functionality"""
-        server = TaskCoordinatorServerSDK("test-coordinator", "1.0.0")
+    def test_bulk_creation_functionality(self, server):
+        """Test the bulk task and dependency helpers"""
         
-        # Create tasks with dependencies
-        server._create_task({
-            "task_id": "task-1",
-            "title": "First Task",
-            "description": "First task"
-        })
+        results = server._create_tasks_bulk([
+            {"task_id": "bulk-1", "title": "Bulk 1", "description": "First"},
+            {"task_id": "bulk-2", "title": "Bulk 2", "description": "Second"},
+            {"description": "Missing required fields"},
+        ])
         
-        server._create_task({
-            "task_id": "task-2",
-            "title": "Second Task", 
-            "description": "Second task"
-        })
+        assert [r.get("task_id") for r in results] == ["bulk-1", "bulk-2", None]
+        assert "error" in results[2]
         
-        server._add_dependency({
-            "dependent_task_id": "task-2",
-            "depends_on_task_id": "task-1"
-        })
+        results = server._add_dependencies_bulk([
+            ("bulk-2", "bulk-1"),
+            ("bulk-1", "bulk-2"),  # Would close a cycle
+        ])
         
-        # Get blocked tasks
-        result = server._get_blocked_tasks({})
+        assert results[0]["success"] is True
+        assert "error" in results[1]
         
-        assert "blocked_tasks" in result
-        assert "count" in result
-        assert isinstance(result["blocked_tasks"], list)
+        tasks = server.dependency_graph.tasks
+        assert tasks["bulk-2"].has_dependency("bulk-1")
+        assert not tasks["bulk-1"].has_dependency("bulk-2")
     
-    def test_get_ready_tasks_functionality(self):
-        """Test the get ready tasks functionality"""
-        server = TaskCoordinatorServerSDK("test-coordinator", "1.0.0")
-        
-        # Create a task without dependencies
-        server._create_task({
-            "task_id": "ready-task",
-            "title": "Ready Task",
-            "description": "A task ready to run"
+    def test_create_tasks_tool(self, server):
+        """Test the create_tasks tool creates a batch in one call"""
+        result = server._create_tasks({
+            "tasks": [
+                {**BASE_CREATE, "task_id": f"batch-{i}"} for i in range(10)
+            ] + [{"description": "Missing required fields"}]
         })
         
-        # Get ready tasks
-        result = server._get_ready_tasks({})
+        results = result["results"]
+        assert [r.get("task_id") for r in results[:-1]] == [f"batch-{i}" for i in range(10)]
+        assert results[-1] == {"error": "task_id and title are required"}
+        assert len(server._get_ready_tasks({})["ready_tasks"]) == 10
         
-        assert "ready_tasks" in result
-        assert "count" in result
-        assert isinstance(result["ready_tasks"], list)
-        # Should have at least our ready task
-        assert result["count"] >= 1
-    
-    def test_resolve_dependencies_functionality(self):
-        """Test the resolve dependencies functionality"""
-        server = TaskCoordinatorServerSDK("test-coordinator", "1.0.0")
+        assert "error" in server._create_tasks({"tasks": "batch-0"})
         
-        # Create tasks with dependencies
-        server._create_task({
-            "task_id": "task-1",
-            "title": "First Task",
-            "description": "First task"
-        })
+        result = server._create_tasks({"tasks": ["not-a-task", {**BASE_CREATE, "task_id": "after"}]})
+        assert result["results"][0] == {"error": "each task must be an object"}
+        assert result["results"][1]["success"] is True
+    
+    def test_get_blocked_tasks_functionality(self, chain_server):
+        """Test the get blocked tasks functionality"""
+        result = chain_server._get_blocked_tasks({})
         
-        server._create_task({
-            "task_id": "task-2",
-            "title": "Second Task",
-            "description": "Second task"
-        })
+        _assert_shape(result, blocked_tasks=list)
+    
+    def test_get_ready_tasks_functionality(self, chain_server):
+        """Test the get ready tasks functionality"""
+        result = chain_server._get_ready_tasks({})
         
-        server._add_dependency({
-            "dependent_task_id": "task-2",
-            "depends_on_task_id": "task-1"
-        })
+        _assert_shape(result, ready_tasks=list)
+        # Should have at least the chain root
+        assert len(result["ready_tasks"]) >= 1
+    
+    def test_resolve_dependencies_functionality(self, mutable_parent_child_server):
+        """Test the resolve dependencies functionality"""
+        server = mutable_parent_child_server
         
-        # Resolve dependencies for task-1
+        # Resolve dependencies for the parent task
         result = server._resolve_dependencies({
-            "completed_task_id": "task-1"
+            "completed_task_id": "parent-task"
         })
         
+        _assert_shape(result, success=bool, newly_ready_tasks=list)
         assert result["success"] is True
-        assert result["completed_task_id"] == "task-1"
-        assert "newly_ready_tasks" in result
-        assert "count" in result
+        assert result["completed_task_id"] == "parent-task"
     
-    def test_get_visualization_data_functionality(self):
+    def test_get_visualization_data_functionality(self, server):
         """Test the get visualization data functionality"""
-        server = TaskCoordinatorServerSDK("test-coordinator", "1.0.0")
         
         # Create some tasks to visualize
         server._create_task({
@@ -183,103 +269,82 @@ class TestTaskCoordinatorServerSDK:
         # Should return some visualization data structure
         assert isinstance(result, dict)
     
-    def test_server_has_run_method(self):
+    def test_server_has_run_method(self, server):
         """Test server has run method for MCP SDK"""
-        server = TaskCoordinatorServerSDK("test-coordinator", "1.0.0")
         
         # Test that run method exists
         assert hasattr(server, 'run')
         assert callable(getattr(server, 'run'))
     
-    def test_server_tools_registration(self):
-        """Test that tools are registered correctly"""
-        server = TaskCoordinatorServerSDK("test-coordinator", "1.0.0")
+    def test_reset_clears_state(self):
+        """Test reset empties the graph but keeps the server usable"""
+        server = TaskCoordinatorServerSDK("reset-test", "1.0.0")
+        server._create_task({**BASE_CREATE, "task_id": "reset-task"})
+        server.notification_system.register_callback("task_completed", lambda event: None)
         
-        # Verify server has the MCP server instance
-        assert server.server is not None
+        server.reset()
         
+        assert server._get_ready_tasks({})["ready_tasks"] == []
+        assert server.notification_system.callbacks == {}
+        assert server._create_task({**BASE_CREATE, "task_id": "reset-task"})["success"] is True
+    
+    def test_tool_schemas_match_methods(self):
+        """Test that the prebuilt tool list covers every tool method"""
+        assert TOOLS_BY_NAME.keys() == {name.lstrip("_") for name in EXPECTED_METHODS}
+    
+    @pytest.mark.parametrize(
+        "tool_name,required",
+        [
+            ("create_task", ["task_id", "title"]),
+            ("add_dependency", ["dependent_task_id", "depends_on_task_id"]),
+            ("resolve_dependencies", ["completed_task_id"]),
+        ],
+    )
+    def test_tool_required_arguments(self, tool_name, required):
+        """Test that tools declare the arguments their methods validate"""
+        assert TOOLS_BY_NAME[tool_name].inputSchema["required"] == required
+    
+    def test_server_tools_registration(self, server):
+        """Test that every method backing an MCP tool exists"""
         # The tools are registered via decorators, so we can't easily test them
         # without actually running the server, but we can verify the methods exist
-        assert hasattr(server, '_create_task')
-        assert hasattr(server, '_add_dependency')
-        assert hasattr(server, '_get_blocked_tasks')
-        assert hasattr(server, '_get_ready_tasks')
-        assert hasattr(server, '_resolve_dependencies')
-        assert hasattr(server, '_get_visualization_data')
+        assert EXPECTED_METHODS.issubset(dir(server)), sorted(EXPECTED_METHODS - set(dir(server)))
 
 
+@pytest.mark.integration
 class TestSDKTaskCoordinatorIntegration:
     """Test integration between SDK wrapper and legacy task coordinator"""
     
-    def test_complete_task_workflow(self):
+    def test_complete_task_workflow(self, mutable_chain_server):
         """Test complete task coordination workflow"""
-        server = TaskCoordinatorServerSDK("integration-test", "1.0.0")
-        
-        # Create multiple tasks with dependencies
-        server._create_task({
-            "task_id": "workflow-task-1",
-            "title": "Workflow Task 1",
-            "description": "First task in workflow",
-            "priority": 10
-        })
-        
-        server._create_task({
-            "task_id": "workflow-task-2",
-            "title": "Workflow Task 2", 
-            "description": "Second task in workflow",
-            "priority": 5
-        })
+        server = mutable_chain_server
         
-        server._create_task({
-            "task_id": "workflow-task-3",
-            "title": "Workflow Task 3",
-            "description": "Third task in workflow",
-            "priority": 1
-        })
-        
-        # Add dependencies: task-2 depends on task-1, task-3 depends on task-2
-        server._add_dependency({
-            "dependent_task_id": "workflow-task-2",
-            "depends_on_task_id": "workflow-task-1"
-        })
+        # Initially, only the chain root should be ready
+        ready_task_ids = set(server._get_ready_tasks({})["ready_tasks"])
+        assert {"chain-task-0"} <= ready_task_ids
         
-        server._add_dependency({
-            "dependent_task_id": "workflow-task-3",
-            "depends_on_task_id": "workflow-task-2"
-        })
+        # Downstream tasks should be blocked
+        blocked_task_ids = set(server._get_blocked_tasks({})["blocked_tasks"])
+        assert {"chain-task-1", "chain-task-2"} <= blocked_task_ids
         
-        # Initially, only task-1 should be ready
-        ready_tasks = server._get_ready_tasks({})
-        ready_task_ids = ready_tasks["ready_tasks"]  # These are strings, not objects
-        assert "workflow-task-1" in ready_task_ids
-        
-        # Tasks 2 and 3 should be blocked
-        blocked_tasks = server._get_blocked_tasks({})
-        blocked_task_ids = blocked_tasks["blocked_tasks"]  # These are strings, not objects
-        assert "workflow-task-2" in blocked_task_ids
-        assert "workflow-task-3" in blocked_task_ids
-        
-        # Complete task-1
+        # Complete the chain root
         resolve_result = server._resolve_dependencies({
-            "completed_task_id": "workflow-task-1"
+            "completed_task_id": "chain-task-0"
         })
         
         assert resolve_result["success"] is True
-        newly_ready = resolve_result["newly_ready_tasks"]  # These are strings, not objects
-        assert "workflow-task-2" in newly_ready
+        # Only the direct dependent is touched, not the rest of the chain
+        assert resolve_result["newly_ready_tasks"] == ["chain-task-1"]
         
-        # Now task-2 should be ready, but task-3 still blocked
-        ready_tasks = server._get_ready_tasks({})
-        ready_task_ids = ready_tasks["ready_tasks"]  # These are strings, not objects
-        assert "workflow-task-2" in ready_task_ids
+        # Now chain-task-1 should be ready, but chain-task-2 still blocked
+        ready_task_ids = set(server._get_ready_tasks({})["ready_tasks"])
+        assert {"chain-task-1"} <= ready_task_ids
         
-        blocked_tasks = server._get_blocked_tasks({})
-        blocked_task_ids = blocked_tasks["blocked_tasks"]  # These are strings, not objects
-        assert "workflow-task-3" in blocked_task_ids
+        blocked_task_ids = set(server._get_blocked_tasks({})["blocked_tasks"])
+        assert {"chain-task-2"} <= blocked_task_ids
     
-    def test_error_handling(self):
+    def test_error_handling(self, server):
         """Test error handling in the SDK wrapper"""
-        server = TaskCoordinatorServerSDK("error-test", "1.0.0")
         
         # Test creating task with missing required fields
         result = server._create_task({
@@ -303,87 +368,79 @@ class TestSDKTaskCoordinatorIntegration:
 class TestMCPToolCallHandler:
     """Test the MCP tool call handler functionality"""
     
-    @pytest.mark.asyncio
-    async def test_tool_call_create_task(self):
+    def test_tool_call_create_task(self, server):
         """Test MCP tool call for create_task"""
         
-        server = TaskCoordinatorServerSDK("tool-test", "1.0.0")
-        
-        # Mock the call_tool decorator functionality
         # Since we can't easily test the decorated function directly,
-        # we'll test the underlying logic and simulate the handler
-        arguments = {
+        # we test the result the call_tool handler would serialize
+        result = server._create_task({
             "task_id": "tool-test-task",
             "title": "Tool Test Task", 
             "description": "Task created via tool call"
-        }
-        
-        # This simulates what the call_tool handler does
-        try:
-            result = server._create_task(arguments)
-            text_content = TextContent(type="text", text=json.dumps(result, indent=2))
-            assert text_content.type == "text"
-            assert "tool-test-task" in text_content.text
-        except Exception as e:
-            text_content = TextContent(type="text", text=f"Error: {str(e)}")
-            assert "Error:" in text_content.text
+        })
+        
+        assert result["success"] is True
+        assert result["task_id"] == "tool-test-task"
     
-    @pytest.mark.asyncio 
-    async def test_tool_call_unknown_tool(self):
+    @pytest.mark.asyncio
+    async def test_tool_call_unknown_tool(self, server):
         """Test MCP tool call with unknown tool name"""
-        server = TaskCoordinatorServerSDK("tool-test", "1.0.0")
-        
-        # Simulate calling an unknown tool
-        # The actual handler would return an error for unknown tools
-        result = {"error": "Unknown tool: unknown_tool_name"}
-        text_content = TextContent(type="text", text=json.dumps(result, indent=2))
+        result = await _call_tool(server, "unknown_tool_name", {})
         
-        assert "Unknown tool" in text_content.text
-        assert "error" in text_content.text
+        assert result == {"error": "Unknown tool: unknown_tool_name"}
         
     @pytest.mark.asyncio
-    async def test_tool_call_dependency_error(self):
-        """Test MCP tool call that triggers DependencyError"""
-        from src.models.dependency import DependencyError
+    async def test_tool_call_readd_dependency(self, server):
+        """Test re-creating a task and re-adding its dependency blocks it again"""
+        await _call_tool(server, "create_tasks", {"tasks": [
+            {**BASE_CREATE, "task_id": "a"},
+            {**BASE_CREATE, "task_id": "b", "dependencies": ["a"]},
+        ]})
+        await _call_tool(server, "create_task", {**BASE_CREATE, "task_id": "b"})
+        
+        result = await _call_tool(
+            server, "add_dependency", {"dependent_task_id": "b", "depends_on_task_id": "a"}
+        )
+        assert result["success"] is True
         
-        server = TaskCoordinatorServerSDK("tool-test", "1.0.0")
+        blocked = await _call_tool(server, "get_blocked_tasks", {})
+        ready = await _call_tool(server, "get_ready_tasks", {})
+        assert blocked["blocked_tasks"] == ["b"]
+        assert ready["ready_tasks"] == ["a"]
+        
+    def test_tool_call_dependency_error(self, server):
+        """Test MCP tool call that triggers DependencyError"""
         
         # Create a task
-        server._create_task({
-            "task_id": "dep-error-task",
-            "title": "Dependency Error Task",
-            "description": "Task for testing dependency errors"
+        server._create_task({**BASE_CREATE, "task_id": "dep-error-task"})
+        
+        # Self-dependency creates a cycle; the DependencyError is reported in the result
+        result = server._add_dependency({
+            "dependent_task_id": "dep-error-task", 
+            "depends_on_task_id": "dep-error-task"
         })
         
-        # Try to create a dependency cycle (should trigger DependencyError)
-        try:
-            server._add_dependency({
-                "dependent_task_id": "dep-error-task", 
-                "depends_on_task_id": "dep-error-task"  # Self-dependency creates cycle
-            })
-        except DependencyError as e:
-            # Simulate what the tool handler does
-            text_content = TextContent(type="text", text=f"Dependency Error: {str(e)}")
-            assert "Dependency Error:" in text_content.text
+        assert "Circular dependency detected" in result["error"]
     
-    @pytest.mark.asyncio
-    async def test_tool_call_general_exception(self):
+    def test_tool_call_general_exception(self, server):
         """Test MCP tool call that triggers general exception"""
         
-        server = TaskCoordinatorServerSDK("tool-test", "1.0.0")
+        # Invalid arguments are reported in the result rather than raised
+        result = server._create_task(None)
         
-        # Test with invalid arguments that would cause a general exception
-        try:
-            # This should cause a KeyError or similar
-            server._create_task(None)  # Invalid arguments
-        except Exception as e:
-            # Simulate what the tool handler does
-            text_content = TextContent(type="text", text=f"Error: {str(e)}")
-            assert "Error:" in text_content.text
+        assert "error" in result
+
+    def test_tool_result_serialization(self, chain_server):
+        """Test tool results are serialized as compact, round-trippable JSON"""
+        result = chain_server._get_visualization_data({})
+        text = _dumps(result)
+        
+        assert json.loads(text) == result
+        assert "\n" not in text
+        assert ", " not in text
             
-    def test_run_method_exists(self):
+    def test_run_method_exists(self, server):
         """Test that the run method exists and can be called"""
-        server = TaskCoordinatorServerSDK("run-test", "1.0.0")
         
         # Test that run method exists
         assert hasattr(server, 'run')
@@ -392,70 +449,40 @@ class TestMCPToolCallHandler:
         # The actual run method is from the MCP SDK, we just verify it exists
         # since running it would start the actual server
         
-    def test_list_tools_functionality(self):
-        """Test that list_tools returns proper tool definitions"""
-        server = TaskCoordinatorServerSDK("tools-test", "1.0.0")
-        
-        # The tools are registered via decorators, verify the server setup
-        assert server.server is not None
-        
-        # Verify the main methods exist that would be called by tools
-        assert hasattr(server, '_create_task')
-        assert hasattr(server, '_add_dependency') 
-        assert hasattr(server, '_get_blocked_tasks')
-        assert hasattr(server, '_get_ready_tasks')
-        assert hasattr(server, '_resolve_dependencies')
-        assert hasattr(server, '_get_visualization_data')
-        
-    def test_server_logging_setup(self):
+    def test_server_logging_setup(self, server):
         """Test that server logging is properly configured"""
-        server = TaskCoordinatorServerSDK("logging-test", "1.0.0")
         
-        # Verify logger exists
-        assert hasattr(server, 'logger')
-        assert server.logger is not None
-        
-        # Test that we can log messages (this exercises the logger setup)
-        server.logger.info("Test log message")
-        server.logger.error("Test error message")
-        
-        # No assertion needed, just verify no exceptions are thrown
+        # Verify logger exists without dispatching records to its handlers
+        assert isinstance(server.logger, logging.Logger)
+        assert server.logger.name == server.name
 
-    def test_resource_functionality(self):
+    def test_resource_functionality(self, server):
         """Test resource-related functionality"""
-        server = TaskCoordinatorServerSDK("resource-test", "1.0.0")
-        
-        # Create some tasks for testing resources
-        server._create_task({
-            "task_id": "resource-task-1",
-            "title": "Resource Task 1",
-            "description": "First task for resource testing"
-        })
         
-        server._create_task({
-            "task_id": "resource-task-2",
-            "title": "Resource Task 2",
-            "description": "Second task for resource testing"
-        })
-        
-        # Add dependency to have blocked tasks
-        server._add_dependency({
-            "dependent_task_id": "resource-task-2",
-            "depends_on_task_id": "resource-task-1"
-        })
+        # Create some tasks for testing resources, with a dependency so
+        # that one of them is blocked
+        server._create_tasks_bulk([
+            {
+                "task_id": "resource-task-1",
+                "title": "Resource Task 1",
+                "description": "First task for resource testing"
+            },
+            {
+                "task_id": "resource-task-2",
+                "title": "Resource Task 2",
+                "description": "Second task for resource testing"
+            },
+        ])
+        server._add_dependencies_bulk([("resource-task-2", "resource-task-1")])
         
         # Test that resource methods work
         blocked_data = server._get_blocked_tasks({})
         ready_data = server._get_ready_tasks({})
         graph_data = server._get_visualization_data({})
         
-        assert isinstance(blocked_data, dict)
-        assert isinstance(ready_data, dict)
-        assert isinstance(graph_data, dict)
-        
-        # Verify the data contains expected elements
-        assert "blocked_tasks" in blocked_data
-        assert "ready_tasks" in ready_data
+        _assert_shape(blocked_data, blocked_tasks=list)
+        _assert_shape(ready_data, ready_tasks=list)
+        _assert_shape(graph_data, nodes=list, edges=list)
 
     def test_server_initialization_with_defaults(self):
         """Test server initialization with default parameters"""
@@ -483,117 +510,82 @@ class TestMCPToolCallHandler:
         assert server.dependency_graph.notification_system is not None
         assert server.dependency_graph.notification_system == server.notification_system
 
-    def test_task_creation_edge_cases(self):
-        """Test task creation with various edge cases"""
-        server = TaskCoordinatorServerSDK("edge-test", "1.0.0")
-        
-        # Test task creation with minimal required data
-        result = server._create_task({
-            "task_id": "minimal-task",
-            "title": "Minimal Task",
-            "description": "A minimal task description"
-        })
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            {},
+            {"priority": 8, "dependencies": []},
+            {"priority": 10},
+        ],
+        ids=["minimal", "all-optional-fields", "priority-edge-value"],
+    )
+    def test_task_creation_edge_cases(self, server, extra):
+        """Test task creation with minimal, full and edge-value arguments"""
+        result = server._create_task({**BASE_CREATE, "task_id": "edge-task", **extra})
         assert result["success"] is True
-        
-        # Test task creation with all optional fields
-        result = server._create_task({
-            "task_id": "full-task",
-            "title": "Full Task",
-            "description": "A fully specified task",
-            "priority": 8,
-            "dependencies": []
-        })
-        assert result["success"] is True
-        
-        # Test task creation with priority edge values
-        result = server._create_task({
-            "task_id": "high-priority-task",
-            "title": "High Priority Task",
-            "description": "High priority task description",
-            "priority": 10
-        })
-        assert result["success"] is True
-        
-        # Test task creation with invalid data (missing required fields)
-        result = server._create_task({
-            "task_id": "invalid-task"
-            # Missing title and description
-        })
-        assert "error" in result
+    
+    @pytest.mark.parametrize(
+        "bad_args",
+        [
+            {"task_id": "invalid-task"},
+            {"title": "Invalid Task"},
+            {"task_id": "", "title": "Invalid Task"},
+            {"task_id": "invalid-task", "title": None},
+        ],
+        ids=["missing-title", "missing-task-id", "empty-task-id", "null-title"],
+    )
+    def test_task_creation_validation_errors(self, server, bad_args):
+        """Test task creation with invalid data (missing required fields)"""
+        result = server._create_task(bad_args)
+        assert result == {"error": "task_id and title are required"}
 
-    def test_dependency_management_comprehensive(self):
+    def test_dependency_management_comprehensive(self, chain_server):
         """Test comprehensive dependency management scenarios"""
-        server = TaskCoordinatorServerSDK("dep-test", "1.0.0")
-        
-        # Create a chain of tasks
-        tasks = []
-        for i in range(5):
-            task_id = f"chain-task-{i}"
-            result = server._create_task({
-                "task_id": task_id,
-                "title": f"Chain Task {i}",
-                "description": f"Task {i} in dependency chain"
-            })
-            assert result["success"] is True
-            tasks.append(task_id)
-        
-        # Create a dependency chain: 0 -> 1 -> 2 -> 3 -> 4
-        for i in range(1, 5):
-            result = server._add_dependency({
-                "dependent_task_id": tasks[i],
-                "depends_on_task_id": tasks[i-1]
-            })
-            assert result["success"] is True
+        tasks = [f"chain-task-{i}" for i in range(5)]
         
         # Test that only the first task is ready
-        ready_tasks = server._get_ready_tasks({})
-        assert tasks[0] in ready_tasks["ready_tasks"]
-        assert ready_tasks["count"] == 1
+        ready_tasks = chain_server._get_ready_tasks({})
+        assert ready_tasks["ready_tasks"] == tasks[:1]
         
         # Test that all other tasks are blocked
-        blocked_tasks = server._get_blocked_tasks({})
-        for i in range(1, 5):
-            assert tasks[i] in blocked_tasks["blocked_tasks"]
-        assert blocked_tasks["count"] == 4
+        blocked_tasks = chain_server._get_blocked_tasks({})
+        assert set(blocked_tasks["blocked_tasks"]) == set(tasks[1:])
 
-    def test_task_completion_workflow(self):
-        """Test complete task workflow with resolution"""
-        server = TaskCoordinatorServerSDK("workflow-test", "1.0.0")
+    @pytest.mark.parametrize("n", [5, 50, pytest.param(500, marks=pytest.mark.slow)])
+    def test_linear_chain_scales(self, server, n):
+        """Test ready/blocked queries on long chains to catch quadratic regressions"""
+        ids = [f"scale-task-{i}" for i in range(n)]
+        server._create_tasks_bulk(
+            [CreateTaskArgs(task_id, f"Scale Task {i}", "") for i, task_id in enumerate(ids)]
+        )
+        results = server._add_dependencies_bulk(list(zip(ids[1:], ids)))
+        assert all(result["success"] is True for result in results)
         
-        # Create tasks
-        server._create_task({
-            "task_id": "parent-task",
-            "title": "Parent Task",
-            "description": "Task that others depend on"
-        })
-        
-        server._create_task({
-            "task_id": "child-task-1",
-            "title": "Child Task 1",
-            "description": "First child task"
-        })
-        
-        server._create_task({
-            "task_id": "child-task-2",
-            "title": "Child Task 2",
-            "description": "Second child task"
-        })
-        
-        # Add dependencies
-        server._add_dependency({
-            "dependent_task_id": "child-task-1",
-            "depends_on_task_id": "parent-task"
-        })
+        ready_tasks = server._get_ready_tasks({})
+        assert ready_tasks["ready_tasks"] == ["scale-task-0"]
         
-        server._add_dependency({
-            "dependent_task_id": "child-task-2",
-            "depends_on_task_id": "parent-task"
-        })
+        blocked_tasks = server._get_blocked_tasks({})
+        assert len(blocked_tasks["blocked_tasks"]) == n - 1
+
+    @pytest.mark.perf
+    def test_bench_create_task(self, benchmark, server):
+        """Benchmark create_task to catch regressions in argument parsing and insertion"""
+        result = benchmark(server._create_task, {**BASE_CREATE, "task_id": "bench-task"})
+        assert result["success"] is True
+
+    @pytest.mark.perf
+    def test_bench_ready_tasks(self, benchmark, chain_server):
+        """Benchmark the ready-task query on an unchanged graph"""
+        result = benchmark(chain_server._get_ready_tasks, {})
+        assert result["ready_tasks"] == ["chain-task-0"]
+
+    def test_task_completion_workflow(self, mutable_parent_child_server):
+        """Test complete task workflow with resolution"""
+        server = mutable_parent_child_server
         
         # Initially only parent should be ready
         ready_tasks = server._get_ready_tasks({})
-        assert "parent-task" in ready_tasks["ready_tasks"]
-        assert ready_tasks["count"] == 1
+        assert ready_tasks["ready_tasks"] == ["parent-task"]
         
         # Complete parent task
         result = server._resolve_dependencies({
@@ -602,10 +594,7 @@ class TestMCPToolCallHandler:
         
         assert result["success"] is True
         assert result["completed_task_id"] == "parent-task"
-        newly_ready = result["newly_ready_tasks"]
-        assert "child-task-1" in newly_ready
-        assert "child-task-2" in newly_ready
-        assert result["count"] == 2
+        assert set(result["newly_ready_tasks"]) == {"child-task-1", "child-task-2"}
 
 
 if __name__ == "__main__":
@@ -3,15 +3,9 @@ Tests for Task model - TDD implementation
 """
 
 import pytest
-from datetime import datetime, timezone
-from typing import List, Set
-
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from datetime import datetime
 
 from src.models.task import Task, TaskStatus
-from src.models.dependency import Dependency
 
 
 class TestTask:
@@ -90,6 +84,43 @@ class TestTask:
         assert "task-3" in task.dependencies
         assert len(task.dependencies) == 1
 
+    def test_task_dependencies_stay_unique(self):
+        """Test duplicate dependency ids are collapsed and lookups stay in step"""
+        task = Task(
+            id="task-1",
+            title="Test Task",
+            description="A test task",
+            dependencies=["task-2", "task-3", "task-2"]
+        )
+        assert task.dependencies == ["task-2", "task-3"]
+        
+        task.add_dependency("task-3")
+        task.add_dependency("task-4")
+        assert task.dependencies == ["task-2", "task-3", "task-4"]
+        
+        task.remove_dependency("task-2")
+        assert not task.has_dependency("task-2")
+        assert task.dependencies == ["task-3", "task-4"]
+
+    def test_task_dependency_lookups_follow_the_lists(self):
+        """Test lookups agree with the lists however they are changed"""
+        task = Task(id="task-1", title="Test Task", description="A test task")
+        
+        task.dependencies = ["task-2"]
+        assert task.has_dependency("task-2")
+        assert not task.can_start()
+        
+        task.dependencies.append("task-3")
+        assert task.has_dependency("task-3")
+        
+        copy = task.model_copy(update={"dependencies": []})
+        assert not copy.has_dependency("task-2")
+        assert copy.can_start()
+        
+        task.dependent_tasks = ["task-3"]
+        task.add_dependent_task("task-3")
+        assert task.dependent_tasks == ["task-3"]
+
     def test_task_has_dependency(self):
         """Test checking if a task has a specific dependency"""
         task = Task(
@@ -1,10 +1,19 @@
 """MCP Server Template Package"""
 
-# MCP Server implementation using official MCP SDK
-from .mcp_server_sdk import MCPServerSDK, create_mcp_server
-
-# Default implementation
-MCPServer = MCPServerSDK
-
 __version__ = "1.0.0"
 __all__ = ["MCPServer", "MCPServerSDK", "create_mcp_server"]
+
+
+def __getattr__(name):
+    # Import the MCP SDK implementation only when first asked for
+    if name in ("MCPServer", "MCPServerSDK", "create_mcp_server"):
+        from .mcp_server_sdk import MCPServerSDK, create_mcp_server
+
+        # Default implementation
+        globals().update(
+            MCPServer=MCPServerSDK,
+            MCPServerSDK=MCPServerSDK,
+            create_mcp_server=create_mcp_server,
+        )
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
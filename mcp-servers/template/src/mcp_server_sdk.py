@@ -7,12 +7,53 @@ A simple template for creating MCP servers using the official MCP Python SDK.
 import json
 import logging
 import sys
-from typing import Any, Dict, List
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 
 
+# Tool definitions are static, so build them once per process rather than
+# on every list request
+_TOOL_SCHEMAS: List[Tool] = [
+    Tool(
+        name="get_server_info",
+        description="Get server information including capabilities",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="echo",
+        description="Echo back the provided message",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "The message to echo back",
+                }
+            },
+            "required": ["message"],
+        },
+    ),
+]
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to compact JSON"""
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Shared by the console handlers of every server instance
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
 class MCPServerSDK:
     """
     MCP Server implementation using the official MCP Python SDK.
@@ -37,6 +78,18 @@ class MCPServerSDK:
         self.server = Server(name)
         self.logger = self._setup_logging()
 
+        # Server info never changes for an instance, so build and serialize
+        # it once
+        self._server_info: Dict[str, Any] = {
+            "name": name,
+            "version": version,
+            "sdk": "official-mcp-python",
+            "capabilities": {
+                "tools": [tool.name for tool in _TOOL_SCHEMAS],
+            },
+        }
+        self._server_info_text = _dumps(self._server_info)
+
         # Register tools
         self._register_tools()
 
@@ -45,63 +98,45 @@ class MCPServerSDK:
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration."""
         logger = logging.getLogger(self.name)
-        logger.setLevel(logging.INFO)
 
-        # Create console handler if not already exists
+        # Configure the logger only the first time a server uses this name,
+        # leaving any level set since then alone
         if not logger.handlers:
             handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
+            handler.setFormatter(_LOG_FORMATTER)
             logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
 
         return logger
 
     def _register_tools(self) -> None:
         """Register MCP tools using the official SDK"""
 
+        # Tool name -> handler producing the response text, built once so
+        # call_tool is a single dict lookup instead of a name comparison chain
+        self._tool_handlers: Dict[str, Callable[[Dict[str, Any]], str]] = {
+            "get_server_info": lambda arguments: self._server_info_text,
+            "echo": lambda arguments: _dumps(
+                self.echo_message(arguments.get("message", ""))
+            ),
+        }
+
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """List available tools"""
-            return [
-                Tool(
-                    name="get_server_info",
-                    description="Get server information including capabilities",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False,
-                    },
-                ),
-                Tool(
-                    name="echo",
-                    description="Echo back the provided message",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "message": {
-                                "type": "string",
-                                "description": "The message to echo back",
-                            }
-                        },
-                        "required": ["message"],
-                    },
-                ),
-            ]
+            return _TOOL_SCHEMAS
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool calls using the MCP SDK"""
             try:
-                if name == "get_server_info":
-                    result = self.get_server_info()
-                elif name == "echo":
-                    result = self.echo_message(arguments.get("message", ""))
+                handler = self._tool_handlers.get(name)
+                if handler is None:
+                    text = _dumps({"error": f"Unknown tool: {name}"})
                 else:
-                    result = {"error": f"Unknown tool: {name}"}
+                    text = handler(arguments)
 
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=text)]
 
             except Exception as e:
                 self.logger.error(f"Error in tool {name}: {str(e)}")
@@ -114,13 +149,11 @@ class MCPServerSDK:
         Returns:
             Dictionary containing server metadata
         """
+        # Hand out a copy so callers can't change what the tool reports
+        info = self._server_info
         return {
-            "name": self.name,
-            "version": self.version,
-            "sdk": "official-mcp-python",
-            "capabilities": {
-                "tools": ["get_server_info", "echo"],
-            },
+            **info,
+            "capabilities": {"tools": list(info["capabilities"]["tools"])},
         }
 
     def echo_message(self, message: str) -> Dict[str, Any]:
@@ -142,8 +175,6 @@ class MCPServerSDK:
 
     def _get_timestamp(self) -> str:
         """Get current timestamp as ISO string"""
-        from datetime import datetime, timezone
-
         return datetime.now(timezone.utc).isoformat()
 
     async def run(self) -> None:
@@ -0,0 +1,10 @@
+"""
+pytest configuration for MCP server template tests.
+"""
+
+import os
+import sys
+
+# Make the package root importable as "src" once for every test module,
+# wherever pytest is started from
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -11,20 +11,12 @@ from pathlib import Path
 def project_setup():
     """Ensure we're running tests from the correct directory."""
     original_cwd = os.getcwd()
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
-    
-    yield
-    
-    os.chdir(original_cwd)
-
-
-@pytest.fixture(scope="function")
-def clean_environment():
-    """Clean up test environment before each test."""
-    # Clean up any test artifacts
-    yield
-    # Post-test cleanup if needed
+    os.chdir(Path(__file__).parent.parent)
+    # Restore the original directory however the session ends
+    try:
+        yield
+    finally:
+        os.chdir(original_cwd)
 
 
 def pytest_configure(config):